@@ -12,6 +12,7 @@ from fastapi import FastAPI, Request
 
 from lords_bot.app.config import get_settings
 from lords_bot.app.token_store import TokenStore
+from lords_bot.app.utils import get_ssl_context
 
 logger = logging.getLogger("lords_bot.auth")
 
@@ -56,7 +57,7 @@ class AuthService:
         """
         Exchange auth code for access token & refresh token.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with httpx.AsyncClient(timeout=30, verify=get_ssl_context()) as client:
             response = await client.post(
                 f"{self._auth_base_url()}/validate-authcode",
                 json={
@@ -109,6 +110,7 @@ class AuthService:
 
         app = FastAPI()
         state: dict[str, str | None] = {"auth_code": None}
+        code_received = asyncio.Event()
 
         @app.get("/")
         async def callback(request: Request) -> dict[str, str]:
@@ -124,6 +126,7 @@ class AuthService:
                 return {"message": "auth_code missing in callback"}
 
             state["auth_code"] = code
+            code_received.set()
             return {"message": "Login successful — you can close this tab."}
 
         # Run local server
@@ -136,8 +139,7 @@ class AuthService:
         # Run server until auth_code arrives
         server_task = asyncio.create_task(server.serve())
         try:
-            while not state["auth_code"]:
-                await asyncio.sleep(0.2)
+            await code_received.wait()
         finally:
             # Trigger shutdown
             server.should_exit = True
@@ -52,23 +52,6 @@ class Settings(BaseSettings):
         # Data REST calls
         return "https://api-t1.fyers.in/data-rest/v3"
 
-    @property
-    def fyers_data_ws_url(self) -> str:
-            fyers_data_ws_url: str = Field(
-                default="wss://api.fyers.in/socket/v2/data/",
-                alias="FYERS_DATA_WS_URL"
-            )
-    def fyers_order_ws_url(self) -> str:
-        return "wss://api.fyers.in/socket/v2/order/"
-
-    @property
-    def fyers_position_ws_url(self) -> str:
-        return "wss://api.fyers.in/socket/v2/position/"
-
-    @property
-    def fyers_trade_ws_url(self) -> str:
-        return "wss://api.fyers.in/socket/v2/trade/"
-
 
     # ==========================================================
     # 📊 TRADING SETTINGS
@@ -13,6 +13,7 @@ import httpx
 
 from lords_bot.app.config import get_settings
 from lords_bot.app.auth import AuthService
+from lords_bot.app.utils import get_ssl_context
 
 api_logger = logging.getLogger("lords_bot.api")
 retry_logger = logging.getLogger("lords_bot.retry")
@@ -60,18 +61,21 @@ class FyersClient:
 
         # Retry config
         self.retry_statuses = {429, 500, 502, 503, 504}
-        self.max_retries = getattr(self.settings, "fyers_max_retries", 3)
-        self.base_backoff = getattr(self.settings, "fyers_retry_backoff_seconds", 0.5)
-        self.max_backoff = getattr(self.settings, "fyers_max_backoff_seconds", 8.0)
+        self.max_retries = self.settings.fyers_max_retries
+        self.base_backoff = self.settings.fyers_retry_backoff_seconds
+        self.max_backoff = self.settings.fyers_max_backoff_seconds
 
         # Circuit breaker config
-        self.failure_threshold = getattr(self.settings, "api_failure_threshold", 5)
-        self.failure_window = getattr(self.settings, "api_failure_window_seconds", 60)
-        self.pause_seconds = getattr(self.settings, "api_pause_seconds", 120)
+        self.failure_threshold = self.settings.api_failure_threshold
+        self.failure_window = self.settings.api_failure_window_seconds
+        self.pause_seconds = self.settings.api_pause_seconds
 
         self._state = CircuitState()
         self._failure_timestamps: deque[float] = deque()
 
+        # One pooled client for the process lifetime; created lazily inside the running loop
+        self._http: httpx.AsyncClient | None = None
+
     # =====================================
     # FIXED PRODUCTION REST ROUTING
     # =====================================
@@ -109,6 +113,23 @@ class FyersClient:
     def trade_ws_url(self) -> str:
         return "wss://api.fyers.in/socket/v2/trade/"
 
+    # =====================================
+    # HTTP Connection Pool
+    # =====================================
+
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                verify=get_ssl_context(),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     # =====================================
     # Auth Header
     # =====================================
@@ -155,6 +176,10 @@ class FyersClient:
                 self.failure_threshold,
             )
 
+    def _next_backoff(self, previous: float) -> float:
+        """Decorrelated jitter: spreads retries so clients don't reconnect in lockstep."""
+        return min(self.max_backoff, random.uniform(self.base_backoff, previous * 3))
+
     # =====================================
     # Auto Login Fallback
     # =====================================
@@ -207,53 +232,54 @@ class FyersClient:
         url = f"{base_url}/{endpoint.lstrip('/')}"
 
         refresh_attempted = False
+        delay = self.base_backoff
+
+        client = self._get_http()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await client.request(
+                    method=method.upper(),
+                    url=url,
+                    headers=self._auth_header(),
+                    params=params,
+                    json=data,
+                    timeout=timeout,
+                )
+            except httpx.HTTPError as exc:
+                self._record_failure()
+                retry_logger.warning("Network error: %s", exc)
+            else:
+                payload = self._safe_parse_json(response)
+
+                # Handle 401
+                if response.status_code == 401 and not refresh_attempted:
+                    refresh_attempted = True
+                    await self._refresh_token()
+                    continue
+
+                # Retryable
+                if response.status_code in self.retry_statuses and attempt < self.max_retries:
+                    self._record_failure()
+                    delay = self._next_backoff(delay)
+                    retry_logger.warning("Retrying in %.2fs", delay)
+                    await asyncio.sleep(delay)
+                    continue
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            for attempt in range(self.max_retries + 1):
-                try:
-                    response = await client.request(
-                        method=method.upper(),
-                        url=url,
-                        headers=self._auth_header(),
-                        params=params,
-                        json=data,
-                    )
-                except httpx.HTTPError as exc:
+                # Error
+                if response.status_code >= 400 or payload.get("s") == "error":
                     self._record_failure()
-                    retry_logger.warning("Network error: %s", exc)
-                else:
-                    payload = self._safe_parse_json(response)
-
-                    # Handle 401
-                    if response.status_code == 401 and not refresh_attempted:
-                        refresh_attempted = True
-                        await self._refresh_token()
-                        continue
-
-                    # Retryable
-                    if response.status_code in self.retry_statuses and attempt < self.max_retries:
-                        self._record_failure()
-                        delay = min(self.max_backoff, self.base_backoff * (2 ** attempt))
-                        delay += random.uniform(0, 0.2 * delay)
-                        retry_logger.warning("Retrying in %.2fs", delay)
-                        await asyncio.sleep(delay)
-                        continue
-
-                    # Error
-                    if response.status_code >= 400 or payload.get("s") == "error":
-                        self._record_failure()
-                        raise FyersAPIError(
-                            payload.get("message", "FYERS error"),
-                            status_code=response.status_code,
-                        )
-
-                    # Success
-                    self._record_success()
-                    return payload
-
-                # Fallback backoff
-                if attempt < self.max_retries:
-                    backoff = min(self.max_backoff, self.base_backoff * (2 ** attempt))
-                    await asyncio.sleep(backoff)
+                    raise FyersAPIError(
+                        payload.get("message", "FYERS error"),
+                        status_code=response.status_code,
+                    )
+
+                # Success
+                self._record_success()
+                return payload
+
+            # Fallback backoff
+            if attempt < self.max_retries:
+                delay = self._next_backoff(delay)
+                await asyncio.sleep(delay)
 
         raise FyersAPIError("FYERS request failed after retries")
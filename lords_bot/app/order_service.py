@@ -6,29 +6,50 @@ import logging
 from typing import Any
 
 from lords_bot.app.fyers_client import FyersClient
+from lords_bot.app.price_bus import PriceBus
 from lords_bot.app.schemas import OrderRequest
+from lords_bot.app.utils import gather_or_cancel, quote_ltp
 
 trade_logger = logging.getLogger("lords_bot.trade")
 
+# Constant ORB entry fields; per-order fields are merged in and the whole order validated.
+_ORB_ORDER_FIELDS: dict[str, Any] = {
+    "type": 2,
+    "productType": "INTRADAY",
+    "limitPrice": 0,
+    "stopPrice": 0,
+    "validity": "DAY",
+    "disclosedQty": 0,
+    "offlineOrder": False,
+    "orderTag": "ORB",
+}
+
 
 class OrderService:
     """Order abstraction with option-chain selection, confirmation, cancel and modify support."""
 
-    def __init__(self, client: FyersClient) -> None:
+    def __init__(self, client: FyersClient, bus: PriceBus | None = None) -> None:
         self.client = client
+        self.bus = bus
 
     async def fetch_ltp(self, symbol: str) -> float:
+        if self.bus is not None:
+            cached = self.bus.get(symbol)
+            if cached is not None:
+                return cached
         quote = await self.client.request("GET", "/quotes", params={"symbols": symbol})
-        return float(quote.get("d", [{}])[0].get("v", {}).get("lp"))
+        return quote_ltp(quote["d"][0])
 
     async def select_atm_option(self, direction: str, underlying: str = "NSE:NIFTY50-INDEX") -> dict[str, Any]:
         """Choose ATM call/put using optionchain endpoint; falls back gracefully if shape varies."""
-        chain = await self.client.request("GET", "/optionchain", params={"symbol": underlying, "strikecount": 10})
+        chain, underlying_ltp = await gather_or_cancel(
+            self.client.request("GET", "/optionchain", params={"symbol": underlying, "strikecount": 10}),
+            self.fetch_ltp(underlying),
+        )
         options = chain.get("data") or chain.get("options") or []
         if not options:
             raise RuntimeError("Option chain unavailable")
 
-        underlying_ltp = await self.fetch_ltp(underlying)
         side_key = "CE" if direction.upper() == "CALL" else "PE"
 
         best = None
@@ -97,21 +118,16 @@ class OrderService:
     async def place_orb_order(self, direction: str, qty: int, sl_pct: float, target_pct: float) -> dict[str, Any]:
         opt = await self.select_atm_option(direction)
         stop_loss, target = self.build_sl_target(opt["ltp"], sl_pct, target_pct)
-        order = {
-            "symbol": opt["symbol"],
-            "qty": qty,
-            "type": 2,
-            "side": 1 if direction.upper() == "CALL" else -1,
-            "productType": "INTRADAY",
-            "limitPrice": 0,
-            "stopPrice": 0,
-            "validity": "DAY",
-            "disclosedQty": 0,
-            "offlineOrder": False,
-            "stopLoss": stop_loss,
-            "takeProfit": target,
-            "orderTag": "ORB",
-        }
+        order = OrderRequest.model_validate(
+            {
+                **_ORB_ORDER_FIELDS,
+                "symbol": opt["symbol"],
+                "qty": qty,
+                "side": 1 if direction.upper() == "CALL" else -1,
+                "stopLoss": stop_loss,
+                "takeProfit": target,
+            }
+        )
         response = await self.place_order(order)
         fill = await self.confirm_fill_price(opt["symbol"], response)
         return {
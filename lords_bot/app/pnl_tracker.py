@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PnLTracker:
     initial_capital: float
     realized_pnl: float = 0.0
@@ -1,8 +1,12 @@
 from __future__ import annotations
 import asyncio
 import logging
+import time
 from typing import Awaitable, Callable
 
+from lords_bot.app.price_bus import PriceBus
+from lords_bot.app.utils import quote_ltp
+
 logger = logging.getLogger("lords_bot.polling")
 
 
@@ -12,54 +16,82 @@ class PollingService:
     Replaces WebSocket completely.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, bus: PriceBus | None = None, max_pending_ticks: int = 64):
         self.client = client
+        self.bus = bus
         self._running = False
         self._task: asyncio.Task | None = None
+        self._consumer: asyncio.Task | None = None
+        self._ticks: asyncio.Queue[tuple[float, float]] = asyncio.Queue(maxsize=max_pending_ticks)
 
     async def start(
         self,
         symbol: str,
         interval: float,
-        on_tick: Callable[[float], Awaitable[None]],
+        on_tick: Callable[[float, float], Awaitable[None]],
     ) -> None:
         if self._running:
             logger.warning("Polling already running.")
             return
 
         self._running = True
+        self._consumer = asyncio.create_task(self._drain(on_tick))
         self._task = asyncio.create_task(
-            self._loop(symbol, interval, on_tick)
+            self._loop(symbol, interval)
         )
 
     async def stop(self) -> None:
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._consumer):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         logger.info("Polling stopped.")
 
+    def _enqueue(self, ltp: float, polled_at: float) -> None:
+        # A stalled tick handler must not block polling; drop the oldest tick instead.
+        # Ticks carry their poll time so a backlog is judged by when it was quoted, not consumed.
+        if self._ticks.full():
+            self._ticks.get_nowait()
+        self._ticks.put_nowait((ltp, polled_at))
+
+    async def _drain(self, on_tick: Callable[[float, float], Awaitable[None]]) -> None:
+        while True:
+            ltp, polled_at = await self._ticks.get()
+            try:
+                await on_tick(ltp, polled_at)
+            except Exception as e:
+                logger.warning("Tick handler error: %s", e)
+
     async def _loop(
         self,
         symbol: str,
         interval: float,
-        on_tick: Callable[[float], Awaitable[None]],
     ) -> None:
+        request = self.client.request
+        bus = self.bus
+        enqueue = self._enqueue
+        warn = logger.warning
+
         while self._running:
             try:
-                quote = await self.client.request(
+                quote = await request(
                     "GET",
                     "/quotes",
                     params={"symbols": symbol},
                 )
 
-                ltp = float(quote["d"][0]["v"]["lp"])
-                await on_tick(ltp)
+                polled_at = time.time()
+
+                ltp = quote_ltp(quote["d"][0])
+                if bus is not None:
+                    bus.publish(symbol, ltp)
+                enqueue(ltp, polled_at)
 
             except Exception as e:
-                logger.warning("Polling error: %s", e)
+                warn("Polling error: %s", e)
 
             await asyncio.sleep(interval)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import time
+
+
+class PriceBus:
+    """Latest-price cache fed by PollingService so other readers skip a duplicate /quotes call."""
+
+    def __init__(self, max_age_seconds: float = 2.0) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._latest: dict[str, tuple[float, float]] = {}
+
+    def publish(self, symbol: str, ltp: float) -> None:
+        self._latest[symbol] = (ltp, time.monotonic())
+
+    def get(self, symbol: str) -> float | None:
+        """Return the cached LTP, or None when missing or older than max_age_seconds."""
+        entry = self._latest.get(symbol)
+        if entry is None:
+            return None
+        ltp, published_at = entry
+        if time.monotonic() - published_at > self.max_age_seconds:
+            return None
+        return ltp
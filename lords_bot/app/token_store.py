@@ -7,6 +7,9 @@ from typing import Any
 
 logger = logging.getLogger("lords_bot.auth")
 
+# FYERS tokens typically last for a single trading day; 21600 seconds = 6 hours.
+TOKEN_EXPIRY_SECONDS = 21600
+
 class TokenStore:
     """
     Handles storing and loading FYERS tokens with enhanced security and reliability.
@@ -20,17 +23,21 @@ class TokenStore:
         cls.FILE_PATH.parent.mkdir(parents=True, exist_ok=True)
         
         temp_path = cls.FILE_PATH.with_suffix(".tmp")
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            
+            # A temp file left by a crash would keep its old mode; O_CREAT's 0o600 only applies to new files
+            temp_path.unlink(missing_ok=True)
+            # Created owner read/write only, so the token is never world-readable
+            fd = os.open(temp_path, flags, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)  # buffered write loops until every byte is written
+                f.flush()
+                os.fsync(f.fileno())
+
             # Atomic swap
             os.replace(temp_path, cls.FILE_PATH)
-            
-            # Set restrictive permissions (Read/Write for owner only)
-            if os.name != 'nt': # Linux/macOS
-                os.chmod(cls.FILE_PATH, 0o600)
-                
+
             logger.info("Token saved successfully.")
         except Exception as e:
             logger.error(f"Failed to save token: {e}")
@@ -52,12 +59,6 @@ class TokenStore:
             return None
 
     @staticmethod
-    def is_expired(data: dict[str, Any], expiry_seconds: int = 21600) -> bool:
-        """
-        FYERS tokens typically last for a single trading day.
-        21600 seconds = 6 hours.
-        """
-        ts = data.get("timestamp")
-        if not ts:
-            return True
-        return (int(time.time()) - ts) > expiry_seconds
\ No newline at end of file
+    def is_expired(data: dict[str, Any], expiry_seconds: int = TOKEN_EXPIRY_SECONDS) -> bool:
+        """A missing timestamp reads as epoch 0, which is always expired."""
+        return (time.time() - (data.get("timestamp") or 0)) > expiry_seconds
\ No newline at end of file
@@ -1,6 +1,12 @@
+import asyncio
 import logging
+import ssl
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import Any, Awaitable
+
+import certifi
 
 from lords_bot.app.config import get_settings
 
@@ -26,6 +32,35 @@ def configure_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.log_level.upper())
 
+    # httpx logs every request at INFO; with 1s polling that is a line per second.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     if not root_logger.handlers:
         root_logger.addHandler(file_handler)
         root_logger.addHandler(stream_handler)
+
+
+def quote_ltp(entry: dict[str, Any]) -> float:
+    """LTP from one /quotes "d" entry; raises KeyError/TypeError/ValueError on an unexpected shape."""
+    v = entry["v"]
+    lp = v.get("lp")
+    if lp is None:
+        lp = v["ltP"]
+    return lp if type(lp) is float else float(lp)
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """asyncio.gather that cancels the still-pending siblings as soon as one awaitable fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """Shared TLS context so the certifi bundle is parsed once per process."""
+    return ssl.create_default_context(cafile=certifi.where())
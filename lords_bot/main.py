@@ -7,6 +7,7 @@ import uvicorn
 from lords_bot.app.auth import AuthService
 from lords_bot.app.fyers_client import FyersClient
 from lords_bot.app.order_service import OrderService
+from lords_bot.app.price_bus import PriceBus
 from lords_bot.app.risk_engine import RiskEngine
 from lords_bot.app.polling_service import PollingService
 from lords_bot.app.utils import configure_logging
@@ -28,17 +29,18 @@ async def bootstrap() -> None:
     client = FyersClient(auth)
 
     # 🧠 SERVICES
-    order_service = OrderService(client)
+    price_bus = PriceBus()
+    order_service = OrderService(client, price_bus)
     strategy = ORBStrategy(client)
     risk_engine = RiskEngine(client)
 
     await risk_engine.reconcile_positions_on_startup()
 
     # 🔁 REST POLLING (1 second)
-    polling = PollingService(client)
+    polling = PollingService(client, price_bus)
 
-    async def handle_tick(ltp: float) -> None:
-        await strategy.on_new_tick(ltp)
+    async def handle_tick(ltp: float, polled_at: float) -> None:
+        await strategy.on_new_tick(ltp, polled_at)
         signal = await strategy.check_breakout()
         if signal:
             logger.info("Breakout signal: %s", signal)
@@ -55,8 +57,19 @@ async def bootstrap() -> None:
         order_service=order_service,
         trading_mode=client.settings.trading_mode,
     )
-
-    config = uvicorn.Config(ui_app, host="127.0.0.1", port=8080, log_level="info")
+    # Dashboard reads the same strategy/risk instances the polling loop drives
+    ui_app.state.strategy = strategy
+    ui_app.state.risk_engine = risk_engine
+
+    # http="auto" picks httptools when installed; the loop is whatever main() started
+    config = uvicorn.Config(
+        ui_app,
+        host="127.0.0.1",
+        port=8080,
+        log_level="info",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
     server = uvicorn.Server(config)
 
     try:
@@ -67,10 +80,16 @@ async def bootstrap() -> None:
         await polling.stop()
         with contextlib.suppress(Exception):
             await risk_engine.square_off_and_shutdown()
+        await client.aclose()
 
 
 def main() -> None:
-    asyncio.run(bootstrap())
+    try:
+        import uvloop
+    except ImportError:  # Windows / minimal installs fall back to the stdlib loop
+        asyncio.run(bootstrap())
+    else:
+        uvloop.run(bootstrap())
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ from __future__ import annotations
 import datetime as dt
 from typing import Any
 
+from lords_bot.app.utils import gather_or_cancel, quote_ltp
+
 
 class OptionSelector:
     def __init__(self, client) -> None:
@@ -10,7 +12,7 @@ class OptionSelector:
 
     async def get_nifty_ltp(self) -> float:
         response = await self.client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"})
-        return float(response["d"][0]["v"]["lp"])
+        return quote_ltp(response["d"][0])
 
     @staticmethod
     def _round_to_50(price: float) -> int:
@@ -28,14 +30,15 @@ class OptionSelector:
         if side not in {"CALL", "PUT"}:
             raise ValueError("direction must be CALL or PUT")
 
-        nifty_ltp = await self.get_nifty_ltp()
-        atm_strike = self._round_to_50(nifty_ltp)
-
-        chain = await self.client.request(
-            "GET",
-            "/options-chain-v3",
-            params={"symbol": "NSE:NIFTY50-INDEX", "strikecount": "20", "timestamp": ""},
+        nifty_ltp, chain = await gather_or_cancel(
+            self.get_nifty_ltp(),
+            self.client.request(
+                "GET",
+                "/options-chain-v3",
+                params={"symbol": "NSE:NIFTY50-INDEX", "strikecount": "20", "timestamp": ""},
+            ),
         )
+        atm_strike = self._round_to_50(nifty_ltp)
 
         options = chain.get("optionsChain") or chain.get("data") or []
         if not options:
@@ -70,8 +73,11 @@ class OptionSelector:
         if not symbol:
             raise RuntimeError("Option chain response missing tradable symbol.")
 
-        quote = await self.client.request("GET", "/quotes", params={"symbols": symbol})
-        option_ltp = float(quote["d"][0]["v"]["lp"])
+        # The chain row usually carries the LTP already; quote the contract when it is missing or 0
+        option_ltp = self._safe_ltp(selected)
+        if option_ltp is None or option_ltp <= 0:
+            quote = await self.client.request("GET", "/quotes", params={"symbols": symbol})
+            option_ltp = quote_ltp(quote["d"][0])
 
         return {
             "symbol": symbol,
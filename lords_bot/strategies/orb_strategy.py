@@ -2,15 +2,47 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import time
+from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 from typing import TYPE_CHECKING
 
+from lords_bot.app.fyers_client import FyersAPIError
+from lords_bot.app.utils import quote_ltp
+
 if TYPE_CHECKING:
     from lords_bot.app.fyers_client import FyersClient
 
 logger = logging.getLogger("lords_bot.strategy")
 
 IST = ZoneInfo("Asia/Kolkata")
+ORB_START = dt.time(9, 15)
+ORB_END = dt.time(9, 30)
+MIDNIGHT = dt.time(0)
+LAST_PRICE_MAX_AGE = 2.0
+
+
+@dataclass(slots=True)
+class TickState:
+    """Running aggregates for the ORB window; constant memory whatever the tick rate."""
+
+    high: float | None = None
+    low: float | None = None
+    n_samples: int = 0
+    # Latest polled tick; check_breakout prefers it over a /quotes round-trip
+    last_price: float | None = None
+    last_tick_ts: float = 0.0
+
+
+@dataclass(slots=True)
+class Breakout:
+    """Signal emitted by check_breakout; source is "tick" (cached price) or "rest"."""
+
+    direction: str
+    price: float
+    range_high: float
+    range_low: float
+    source: str
 
 
 class ORBStrategy:
@@ -32,38 +64,72 @@ class ORBStrategy:
 
         self.range_high: float | None = None
         self.range_low: float | None = None
-        self.range_locked: bool = False
+        self.range_date: dt.date | None = None
+
+        self.tick_state = TickState()
+
+        # Epoch bounds of today's ORB window; refreshed by _roll_window at IST midnight
+        self._session_date: dt.date | None = None
+        self._window_start = 0.0
+        self._window_end = 0.0
+        self._day_end = 0.0
+        self._roll_window(time.time())
 
-        self.live_ticks: list[float] = []
+    @property
+    def range_locked(self) -> bool:
+        """The ORB is computed once per IST day and stays cached until the day rolls."""
+        return self.range_date is not None and self.range_date == self._session_date
 
     # ---------------------------------------------------------
     # Time helper
     # ---------------------------------------------------------
 
-    def _current_ist_time(self) -> dt.time:
-        return dt.datetime.now(tz=IST).time()
+    def _roll_window(self, now_ts: float) -> None:
+        """Precompute the day's 9:15/9:30 IST bounds so each tick is a float compare."""
+        today = dt.datetime.fromtimestamp(now_ts, tz=IST).date()
+        self._session_date = today
+        self._window_start = dt.datetime.combine(today, ORB_START, IST).timestamp()
+        self._window_end = dt.datetime.combine(today, ORB_END, IST).timestamp()
+        self._day_end = dt.datetime.combine(today + dt.timedelta(days=1), MIDNIGHT, IST).timestamp()
 
     # ---------------------------------------------------------
     # Tick handler (called by PollingService)
     # ---------------------------------------------------------
 
-    async def on_new_tick(self, ltp: float) -> None:
-        now = self._current_ist_time()
+    async def on_new_tick(self, ltp: float, polled_at: float | None = None) -> None:
+        # polled_at is when the quote was fetched; a queued tick must not be stamped on consumption
+        now = time.time() if polled_at is None else polled_at
+        if now >= self._day_end:
+            self._roll_window(now)
+            self.tick_state = TickState()
+            self.range_high = None
+            self.range_low = None
+
+        st = self.tick_state
+        st.last_price = ltp
+        st.last_tick_ts = now
 
         # Collect ticks during ORB window
-        if dt.time(9, 15) <= now < dt.time(9, 30):
-            self.live_ticks.append(ltp)
-            logger.debug("Collecting ORB tick: %s", ltp)
+        if self._window_start <= now < self._window_end:
+            st.n_samples += 1
+            high = st.high
+            if high is None or ltp > high:
+                st.high = ltp
+            low = st.low
+            if low is None or ltp < low:
+                st.low = ltp
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Collecting ORB tick: %s", ltp)
 
         # Lock range at 9:30
-        if now >= dt.time(9, 30) and not self.range_locked:
-            if not self.live_ticks:
+        if now >= self._window_end and not self.range_locked:
+            if not self.tick_state.n_samples:
                 logger.warning("No ticks collected for ORB window.")
                 return
 
-            self.range_high = max(self.live_ticks)
-            self.range_low = min(self.live_ticks)
-            self.range_locked = True
+            self.range_high = self.tick_state.high
+            self.range_low = self.tick_state.low
+            self.range_date = self._session_date
 
             logger.info(
                 "ORB Range Locked → HIGH=%s LOW=%s",
@@ -82,40 +148,44 @@ class ORBStrategy:
                 endpoint="/quotes",
                 params={"symbols": self.symbol},
             )
-
-            data_d = response.get("d")
-            if isinstance(data_d, list) and data_d:
-                v = data_d[0].get("v", {})
-                raw_ltp = v.get("lp") or v.get("ltP")
-                if raw_ltp is not None:
-                    return float(raw_ltp)
-
-        except Exception as exc:
+        except FyersAPIError as exc:
             logger.warning("Failed to fetch LTP: %s", exc)
+            return None
 
-        return None
+        try:
+            return quote_ltp(response["d"][0])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
 
     # ---------------------------------------------------------
     # Breakout Logic
     # ---------------------------------------------------------
 
-    async def check_breakout(self) -> dict[str, object] | None:
+    async def check_breakout(self) -> Breakout | None:
 
         if not self.range_locked:
             return None
 
-        ltp = await self.fetch_quote_ltp()
+        st = self.tick_state
+        ltp = st.last_price
+        source = "tick"
+        if ltp is None or time.time() - st.last_tick_ts >= LAST_PRICE_MAX_AGE:
+            ltp = await self.fetch_quote_ltp()
+            source = "rest"
         if ltp is None:
             return None
 
+        high = self.range_high
+        low = self.range_low
+
         # Breakout above range
-        if self.range_high is not None and ltp > self.range_high:
+        if high is not None and ltp > high:
             logger.info("ORB BREAKOUT CALL @ %s", ltp)
-            return {"direction": "CALL", "price": ltp}
+            return Breakout("CALL", ltp, high, low, source)
 
         # Breakdown below range
-        if self.range_low is not None and ltp < self.range_low:
+        if low is not None and ltp < low:
             logger.info("ORB BREAKDOWN PUT @ %s", ltp)
-            return {"direction": "PUT", "price": ltp}
+            return Breakout("PUT", ltp, high, low, source)
 
         return None
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import logging
+from operator import attrgetter
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from lords_bot.app.fyers_client import FyersClient
@@ -15,7 +19,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lords_bot.ui")
 
-templates = Jinja2Templates(directory="lords_bot/ui/templates")
+_TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+_orb_range = attrgetter("range_high", "range_low")
+# Shared response payload; FastAPI only reads it, never mutates
+_RESP_OK = {"status": "ok"}
+
+# auto_reload=False: templates ship with the package, so skip the per-render mtime stat
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+    )
+)
+
+
+class MonitorStatus(BaseModel):
+    """/monitor payload."""
+
+    trading_paused: bool
+    trading_pause_remaining: int
+    trading_mode: str
 
 
 def create_ui_app(
@@ -36,34 +60,39 @@ def create_ui_app(
     # -------------------------------
     # Dashboard
     # -------------------------------
+    # Fields fixed for the app's lifetime are resolved once; index() only fills the live ones
+    base_context = {
+        "capital": float(getattr(client.settings, "initial_capital", 0.0)),
+        "trading_mode": trading_mode,
+    }
+
     @app.get("/", response_class=HTMLResponse)
     async def index(request: Request):
-        strat: "ORBStrategy" | None = getattr(request.app.state, "strategy", None)
-        risk: "RiskEngine" | None = getattr(request.app.state, "risk_engine", None)
+        state = request.app.state
+        strat: "ORBStrategy" | None = getattr(state, "strategy", None)
+        risk: "RiskEngine" | None = getattr(state, "risk_engine", None)
 
-        # Safe defaults
-        initial_capital = float(getattr(client.settings, "initial_capital", 0.0))
         daily_loss = float(getattr(risk, "daily_loss", 0.0))
 
+        context = base_context.copy()
+        context["daily_loss"] = daily_loss
         # Basic PnL calculation (can later connect to real tracker)
-        pnl = -daily_loss
-
-        circuit_paused = client.is_trading_paused()
-
-        return templates.TemplateResponse(
-            "index.html",
-            {
-                "request": request,
-                "capital": initial_capital,
-                "daily_loss": daily_loss,
-                "pnl": pnl,  # 🔥 FIXED: always defined
-                "circuit_paused": circuit_paused,
-                "range_high": getattr(strat, "range_high", None),
-                "range_low": getattr(strat, "range_low", None),
-                "trading_mode": trading_mode,
-            },
+        context["pnl"] = -daily_loss
+        context["circuit_paused"] = client.is_trading_paused()
+        context["range_high"], context["range_low"] = (
+            _orb_range(strat) if strat is not None else (None, None)
         )
 
+        # Unchanged dashboard state → let a polling browser reuse its copy without rendering
+        etag = f'W/"{hash(tuple(context.values())):x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response = templates.TemplateResponse(request, "index.html", context)
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+        return response
+
     # -------------------------------
     # Reset Daily Risk
     # -------------------------------
@@ -74,17 +103,18 @@ def create_ui_app(
             risk.daily_loss = 0.0
             logger.info("Daily loss reset via UI")
 
-        return {"status": "ok"}
+        return _RESP_OK
 
     # -------------------------------
     # Monitoring Endpoint
     # -------------------------------
     @app.get("/monitor")
-    async def monitor():
-        return {
-            "trading_paused": client.is_trading_paused(),
-            "trading_pause_remaining": client.trading_pause_remaining_seconds,
-            "trading_mode": trading_mode,
-        }
+    async def monitor() -> MonitorStatus:
+        # Typed return lets FastAPI serialize via pydantic-core instead of jsonable_encoder
+        return MonitorStatus(
+            trading_paused=client.is_trading_paused(),
+            trading_pause_remaining=client.trading_pause_remaining_seconds,
+            trading_mode=trading_mode,
+        )
 
     return app
\ No newline at end of file
@@ -0,0 +1,10 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Share one event loop across the session instead of asyncio.run's loop per call."""
+    with asyncio.Runner() as runner:
+        yield runner.run
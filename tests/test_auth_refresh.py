@@ -1,11 +1,9 @@
-import asyncio
-
 import httpx
 
 from lords_bot.app.auth import AuthService
 
 
-def test_refresh_uses_token_endpoint(monkeypatch):
+def test_refresh_uses_token_endpoint(run_async, monkeypatch):
     svc = AuthService()
     svc.refresh_token = "r1"
 
@@ -16,7 +14,7 @@ def test_refresh_uses_token_endpoint(monkeypatch):
         return httpx.Response(200, json={"s": "ok", "access_token": "new"})
 
     monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
-    out = asyncio.run(svc.refresh_access_token())
+    out = run_async(svc.refresh_access_token())
     assert out["access_token"] == "new"
     assert svc.access_token == "new"
     assert calls["url"].endswith("/token")
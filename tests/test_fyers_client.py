@@ -1,5 +1,3 @@
-import asyncio
-
 import httpx
 import pytest
 
@@ -16,7 +14,7 @@ class DummyAuth:
         self.refreshed = True
 
 
-def test_retry_on_503(monkeypatch):
+def test_retry_on_503(run_async, monkeypatch):
     auth = DummyAuth()
     client = FyersClient(auth)
     calls = {"n": 0}
@@ -28,12 +26,12 @@ def test_retry_on_503(monkeypatch):
         return httpx.Response(200, json={"s": "ok", "foo": "bar"})
 
     monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
-    out = asyncio.run(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
+    out = run_async(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
     assert out["foo"] == "bar"
     assert calls["n"] == 2
 
 
-def test_refresh_on_401(monkeypatch):
+def test_refresh_on_401(run_async, monkeypatch):
     auth = DummyAuth()
     client = FyersClient(auth)
     calls = {"n": 0}
@@ -45,12 +43,12 @@ def test_refresh_on_401(monkeypatch):
         return httpx.Response(200, json={"s": "ok"})
 
     monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
-    out = asyncio.run(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
+    out = run_async(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
     assert out["s"] == "ok"
     assert auth.refreshed is True
 
 
-def test_circuit_breaker_engages(monkeypatch):
+def test_circuit_breaker_engages(run_async, monkeypatch):
     auth = DummyAuth()
     client = FyersClient(auth)
     client.failure_threshold = 2
@@ -62,8 +60,8 @@ def test_circuit_breaker_engages(monkeypatch):
     monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
 
     with pytest.raises(FyersAPIError):
-        asyncio.run(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
+        run_async(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
     with pytest.raises(FyersAPIError):
-        asyncio.run(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
+        run_async(client.request("GET", "/quotes", params={"symbols": "NSE:NIFTY50-INDEX"}))
 
     assert client.is_trading_paused() is True
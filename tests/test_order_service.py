@@ -0,0 +1,34 @@
+from lords_bot.app import price_bus
+from lords_bot.app.order_service import OrderService
+from lords_bot.app.price_bus import PriceBus
+
+
+class QuoteClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def request(self, method, endpoint, **kwargs):
+        self.calls += 1
+        return {"s": "ok", "d": [{"v": {"lp": 250.0}}]}
+
+
+def test_fetch_ltp_uses_fresh_bus_price(run_async, monkeypatch):
+    monkeypatch.setattr(price_bus.time, "monotonic", lambda: 100.0)
+    client = QuoteClient()
+    bus = PriceBus(max_age_seconds=2.0)
+    bus.publish("NSE:NIFTY50-INDEX", 25000.0)
+
+    assert run_async(OrderService(client, bus).fetch_ltp("NSE:NIFTY50-INDEX")) == 25000.0
+    assert client.calls == 0
+
+
+def test_fetch_ltp_falls_back_to_rest_when_bus_price_is_stale(run_async, monkeypatch):
+    now = {"t": 100.0}
+    monkeypatch.setattr(price_bus.time, "monotonic", lambda: now["t"])
+    client = QuoteClient()
+    bus = PriceBus(max_age_seconds=2.0)
+    bus.publish("NSE:NIFTY50-INDEX", 25000.0)
+    now["t"] = 102.5
+
+    assert run_async(OrderService(client, bus).fetch_ltp("NSE:NIFTY50-INDEX")) == 250.0
+    assert client.calls == 1
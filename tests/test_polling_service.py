@@ -0,0 +1,60 @@
+import asyncio
+
+from lords_bot.app.polling_service import PollingService
+from lords_bot.app.price_bus import PriceBus
+
+
+class QuoteClient:
+    def __init__(self):
+        self.calls = []
+
+    async def request(self, method, endpoint, **kwargs):
+        symbol = kwargs["params"]["symbols"]
+        self.calls.append(symbol)
+        return {"s": "ok", "d": [{"n": symbol, "v": {"lp": 100.0}}]}
+
+
+def test_polled_ltp_is_published_to_bus(run_async):
+    client = QuoteClient()
+    bus = PriceBus()
+    polling = PollingService(client, bus)
+    ticks = []
+
+    async def on_tick(ltp, polled_at):
+        ticks.append(ltp)
+
+    async def run():
+        await polling.start("NSE:NIFTY50-INDEX", 0.01, on_tick)
+        await asyncio.sleep(0.03)
+        await polling.stop()
+
+    run_async(run())
+
+    assert client.calls[0] == "NSE:NIFTY50-INDEX"
+    assert ticks and all(t == 100.0 for t in ticks)
+    assert bus.get("NSE:NIFTY50-INDEX") == 100.0
+
+
+def test_slow_tick_handler_does_not_block_polling(run_async):
+    client = QuoteClient()
+    polling = PollingService(client, max_pending_ticks=2)
+    release = asyncio.Event()
+    seen = []
+
+    async def on_tick(ltp, polled_at):
+        seen.append(ltp)
+        await release.wait()
+
+    async def run():
+        await polling.start("NSE:NIFTY50-INDEX", 0.01, on_tick)
+        await asyncio.sleep(0.05)
+        polls_while_blocked = len(client.calls)
+        pending = polling._ticks.qsize()
+        await polling.stop()
+        return polls_while_blocked, pending
+
+    polls_while_blocked, pending = run_async(run())
+
+    assert len(seen) == 1
+    assert polls_while_blocked > 2
+    assert pending == 2
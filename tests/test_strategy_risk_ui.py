@@ -1,14 +1,16 @@
-import asyncio
 import datetime as dt
 
-from fastapi.testclient import TestClient
+import httpx
 
 from lords_bot.app.risk_engine import RiskEngine
-from lords_bot.strategies.orb_strategy import ORBStrategy
+from lords_bot.strategies import orb_strategy
+from lords_bot.strategies.orb_strategy import Breakout, ORBStrategy
 from lords_bot.ui import server as ui_server
 
 
 class StubClient:
+    settings = type("Settings", (), {"initial_capital": 100000.0})()
+
     def __init__(self):
         self.paused = False
 
@@ -41,25 +43,69 @@ class StubOrderService:
         return (90.0, 120.0)
 
 
-class DummyTemplates:
-    def __init__(self, *args, **kwargs):
-        pass
-
-    def TemplateResponse(self, template_name, context):
-        return context
+async def call_ui(app, method, path, **kwargs):
+    # In-process ASGI transport: no server thread or socket per test
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        return await c.request(method, path, **kwargs)
 
 
-def test_orb_builder_from_ticks():
+def test_orb_builder_from_ticks(run_async):
     s = ORBStrategy(StubClient())
-    s.tick_state.samples = [25000, 25010]
+    s.tick_state.n_samples = 2
     s.tick_state.high = 25010
     s.tick_state.low = 25000
-    s.range_date = dt.date.today()
+    s.range_date = s._session_date
     s.range_high = 25010
     s.range_low = 25000
     s.tick_state.last_price = 25020
-    out = asyncio.run(s.check_breakout())
-    assert out and out["direction"] == "CALL"
+    s.tick_state.last_tick_ts = orb_strategy.time.time()
+    out = run_async(s.check_breakout())
+    assert out and out.direction == "CALL"
+
+
+def test_orb_range_locks_from_window_ticks(run_async, monkeypatch):
+    def at(hour, minute):
+        return dt.datetime(2024, 10, 1, hour, minute, tzinfo=orb_strategy.IST).timestamp()
+
+    monkeypatch.setattr(orb_strategy.time, "time", lambda: at(9, 0))
+    s = ORBStrategy(StubClient())
+    for hour, minute, price in [(9, 10, 1.0), (9, 16, 25000.0), (9, 20, 24950.0), (9, 29, 25040.0), (9, 31, 26000.0)]:
+        monkeypatch.setattr(orb_strategy.time, "time", lambda h=hour, m=minute: at(h, m))
+        run_async(s.on_new_tick(price))
+
+    assert s.range_locked is True
+    assert (s.range_high, s.range_low) == (25040.0, 24950.0)
+    assert s.tick_state.n_samples == 3
+
+    next_day = dt.datetime(2024, 10, 2, 9, 0, tzinfo=orb_strategy.IST).timestamp()
+    monkeypatch.setattr(orb_strategy.time, "time", lambda: next_day)
+    run_async(s.on_new_tick(25100.0))
+    assert s.range_locked is False
+    assert s.range_high is None and s.tick_state.n_samples == 0
+
+
+def test_check_breakout_prefers_fresh_tick(run_async, monkeypatch):
+    class NoQuoteClient(StubClient):
+        async def request(self, method, endpoint, **kwargs):
+            raise AssertionError("fresh tick should skip /quotes")
+
+    monkeypatch.setattr(orb_strategy.time, "time", lambda: 1_000_000.0)
+    s = ORBStrategy(NoQuoteClient())
+    s.range_date = s._session_date
+    s.range_high, s.range_low = 25010.0, 25000.0
+    run_async(s.on_new_tick(24990.0))
+    out = run_async(s.check_breakout())
+    assert out == Breakout("PUT", 24990.0, 25010.0, 25000.0, "tick")
+
+
+def test_backlogged_tick_is_judged_by_poll_time(run_async, monkeypatch):
+    monkeypatch.setattr(orb_strategy.time, "time", lambda: 1_000_000.0)
+    s = ORBStrategy(StubClient())
+    s.range_date = s._session_date
+    s.range_high, s.range_low = 25010.0, 25000.0
+    # Polled 10s ago, consumed now: too stale to trust, so check_breakout re-quotes (stub LTP 25000)
+    run_async(s.on_new_tick(24990.0, 1_000_000.0 - 10))
+    assert run_async(s.check_breakout()) is None
 
 
 def test_risk_daily_loss_limit_blocks():
@@ -71,26 +117,35 @@ def test_risk_daily_loss_limit_blocks():
     assert reason == "max_daily_loss_hit"
 
 
-def test_ui_monitor_safe_payload(monkeypatch):
-    monkeypatch.setattr(ui_server, "Jinja2Templates", DummyTemplates)
-    app = ui_server.create_ui_app(StubClient(), StubOrderService(), "PAPER")
-    client = TestClient(app)
-    r = client.get("/monitor")
+def test_ui_monitor_safe_payload(run_async):
+    app = ui_server.create_ui_app(client=StubClient(), order_service=StubOrderService(), trading_mode="PAPER")
+    r = run_async(call_ui(app, "GET", "/monitor"))
     assert r.status_code == 200
     body = r.json()
     assert "capital" in body
     assert "risk_status" in body
 
 
-def test_scan_safe_on_error(monkeypatch):
-    monkeypatch.setattr(ui_server, "Jinja2Templates", DummyTemplates)
-    app = ui_server.create_ui_app(StubClient(), StubOrderService(), "PAPER")
+def test_scan_safe_on_error(run_async, monkeypatch):
+    app = ui_server.create_ui_app(client=StubClient(), order_service=StubOrderService(), trading_mode="PAPER")
 
     async def bad_breakout(self):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(ORBStrategy, "check_breakout", bad_breakout)
-    client = TestClient(app)
-    r = client.post("/scan")
+    r = run_async(call_ui(app, "POST", "/scan"))
     assert r.status_code == 200
     assert r.json()["status"] == "error"
+
+
+def test_ui_index_not_modified_when_state_unchanged(run_async):
+    stub = StubClient()
+    app = ui_server.create_ui_app(client=stub, order_service=StubOrderService(), trading_mode="PAPER")
+    first = run_async(call_ui(app, "GET", "/"))
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    assert run_async(call_ui(app, "GET", "/", headers={"If-None-Match": etag})).status_code == 304
+
+    stub.paused = True
+    assert run_async(call_ui(app, "GET", "/", headers={"If-None-Match": etag})).status_code == 200
@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from lords_bot.app.utils import gather_or_cancel
+
+
+def test_gather_or_cancel_cancels_pending_sibling(run_async):
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await gather_or_cancel(slow(), boom())
+        await asyncio.sleep(0)
+
+    run_async(run())
+    assert cancelled == [True]